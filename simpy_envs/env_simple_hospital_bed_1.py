@@ -1,11 +1,28 @@
-import random
-import simpy
+import heapq
+import itertools
+import numbers
+import numpy as np
+import sys
+
+# Indices of items in state list
+WEEKDAY, BEDS, PATIENTS, SPARE, PENDING = 0, 1, 2, 3, 4
+
+# Kinds of event in simulation event list
+ADMISSION, DISCHARGE, BED_CHANGE = 0, 1, 2
+
 
 class HospGym:
     """
-    A simple SimPy hospital simulation with an OpenAI gym-like interface for 
+    A simple hospital simulation with an OpenAI gym-like interface for 
     Reinforcement Learning.
     
+    The simulation is a discrete event simulation of the same form as a SimPy
+    model, but with its own event list: a calendar of one heap of (time,
+    event id, kind, payload) tuples per whole day of simulation time. The
+    model has only three kinds of event (admission, discharge, bed change),
+    so SimPy processes are not needed. Keeping a heap per day keeps heaps
+    small, and the simulation advances one day's heap at a time.
+    
     Any environment needs:
     * A state space
     * A reward structure
@@ -26,12 +43,12 @@ class HospGym:
 
     __init__:
         Constructor method.
-    _adjust_bed_numbers:
-        Introduces delay before bed numbers actually change
-    _adjust_pending_bed_change:
-        Track pending bed changes in state dictionary
+    _apply_bed_change:
+        Carries out bed change (handler for delayed bed change event)
     _calculate_reward:
         Calculates reward based on empty beds or beds without patient
+    _discharge:
+        Patient(s) leave hospital (handler for discharge event)
     _islegal:
         Checks whether requested action is legal
     _get_obs:
@@ -39,9 +56,15 @@ class HospGym:
     _load_patients:
         Inital load of patients into hospital (avoid starting empty)
     _new_admission:
-        Loop creating new patient admissions
-    _patient_spell:
-        Patient spell in hospital sim
+        New patient admission (handler for admission event)
+    _render_line:
+        Text describing state, for render
+    _run:
+        Process events in event list up to a given time
+    _sample_draws:
+        Pre-generate batch of random samples for admissions (inter-arrival, los)
+    _schedule:
+        Add event to event list
         
         
     Interfacing methods:
@@ -67,6 +90,9 @@ class HospGym:
         Average patient length of stay
     render_env:
         Boolean, render state each action?
+    seed:
+        Seed for random number generator (None for unseeded; not kept as
+        attribute)
     sim_duration:
         Length of simulation run (days)
     target_reserve:
@@ -81,18 +107,24 @@ class HospGym:
     action_size:
         Number of possible actions   
     arrivals_by_day:
-        Dictionary of average arrivals by day of week
+        NumPy array of average arrivals by day of week (indexed by weekday)
+    now:
+        Current simulation time (days)
     observation_size:
         Number of features in observation space
+    s:
+        State list (indexed by module constants WEEKDAY, BEDS, PATIENTS,
+        SPARE, PENDING)
     state:
-        SimPyGymState object (dictionary)
+        State dictionary (read-only view built from state list)
         
         
-    State dictionary
-    ----------------
+    State list
+    ----------
     
-    The state dictionary contains the following items:
-        weekday: day of week (0-6)
+    The state list contains the following items (the state dictionary uses
+    the same names as keys):
+        weekday: day of week (0-6), updated when observations are taken
         beds: number of available beds (free or occupied)
         patients: number of patients in hospital
         spare_beds: number of beds without patient
@@ -101,8 +133,29 @@ class HospGym:
 
     """
     
+    # Fixed set of instance attributes (no per-instance dictionary, for
+    # faster attribute access and less memory per environment)
+    __slots__ = ('action_size', 'actions', 'arrivals_by_day',
+                 'arrivals_per_day', 'delay_to_change_beds', 'los',
+                 'next_time_stop', 'now', 'observation_size', 'render_env',
+                 's', 'sim_duration', 'target_reserve', 'time_step',
+                 '_calendar', '_day', '_draw_idx', '_event_id', '_iat_scale',
+                 '_info', '_legal_actions', '_los_draws', '_obs_buf', '_rng',
+                 '_unit_iat', '_weekday')
+    
+    # Names of items in state list (used for state dictionary)
+    _state_keys = ('weekday', 'beds', 'patients', 'spare_beds',
+                   'pending_bed_change')
+    
+    # Change in beds requested by each action (indexed by action)
+    _BED_DELTA = (-20, -10, 0, 10, 20)
+    
+    # Number of random samples for admissions pre-generated in each batch
+    _DRAW_BATCH = 1024
+    
     def __init__(self, arrivals_per_day=100, delay_to_change_beds=2, los=5,
-                 render_env=False, sim_duration=365, target_reserve=0.05, time_step=1):
+                 render_env=False, sim_duration=365, target_reserve=0.05, time_step=1,
+                 seed=None):
                  
         """
         Constructor method for HospGym class.
@@ -124,6 +177,11 @@ class HospGym:
             target free beds as a proportion of # patients present
         time_step:
             Time between action steps (days)
+        seed:
+            Seed for random number generator, passed to
+            np.random.default_rng (None for unseeded). Successive episodes
+            (resets) continue from the same generator, so a seeded
+            environment reproduces the same sequence of episodes.
         """
         
         # set average length of stay
@@ -132,18 +190,13 @@ class HospGym:
         # Set average arrivals per day
         self.arrivals_per_day = arrivals_per_day
         
-        # Set up state dictionary 
-        self.state = dict()
-        # Weekday count (used for periodicity of demand)
-        self.state['weekday'] = 0
-        # Number of beds in hospital
-        self.state['beds'] = 0
-        # Number of patients in hospital
-        self.state['patients'] = 0
-        # Number of spare beds
-        self.state['spare_beds'] = 0
-        # Tally of bed adjustments waiting
-        self.state['pending_bed_change'] = 0
+        # Set up state list (indexed by WEEKDAY, BEDS, PATIENTS, SPARE, PENDING):
+        # * Weekday count (used for periodicity of demand)
+        # * Number of beds in hospital
+        # * Number of patients in hospital
+        # * Number of spare beds
+        # * Tally of bed adjustments waiting
+        self.s = [0] * 5
         # Show environemnt on each action?
         self.render_env = render_env
         
@@ -151,6 +204,8 @@ class HospGym:
         # 5 actions for change bed number by -20, -10, 0, +10, +20
         # Bed numbers change after set delay
         self.actions = [0,1,2,3,4]
+        # Set of allowed actions (for fast checking of requested actions)
+        self._legal_actions = frozenset(self.actions)
         
         # Set delay_to_change_beds
         self.delay_to_change_beds = delay_to_change_beds
@@ -162,84 +217,76 @@ class HospGym:
         self.sim_duration = sim_duration
         self.time_step = time_step
         self.next_time_stop = 0
+        self.now = 0
+        
+        # Set up event list (dictionary of heaps keyed by day), current day
+        # of event list, and event id counter (event id keeps events
+        # scheduled for the same time in order of scheduling). Weekday is
+        # advanced as the event list moves on to each new day (midnight).
+        self._calendar = dict()
+        self._day = 0
+        self._weekday = 0
+        self._event_id = itertools.count()
         
         # Set up observation and action space sizes
         self.observation_size = 5
         self.action_size = 5
         
-        # Set up dictionary of arrivals by day of week
+        # Buffers reused for returns from reset and step (avoids allocating a
+        # new observations list and info dictionary each step)
+        self._obs_buf = [0] * self.observation_size
+        self._info = dict()
+        
+        # Set up array of arrivals by day of week
         # Weekend days are 50%, and weekday days are 120% of average arrivals 
-        self.arrivals_by_day = dict()
-        for day_num in range(7):
-            if day_num < 5:
-                self.arrivals_by_day[day_num] = arrivals_per_day * 1.2
-            else:
-                self.arrivals_by_day[day_num] = arrivals_per_day * 0.5       
+        self.arrivals_by_day = np.where(np.arange(7) < 5,
+                                        arrivals_per_day * 1.2,
+                                        arrivals_per_day * 0.5)
+        
+        # Average inter-arrival time (scale of exponential) by day of week
+        # (list of floats, for fast indexing in admissions)
+        self._iat_scale = (1.0 / self.arrivals_by_day).tolist()
+        
+        # Set up random number generation. Samples for admissions (unit
+        # exponential inter-arrival times, to be scaled by day of week, and
+        # lengths of stay) are pre-generated from NumPy in fixed size
+        # batches, and used in turn (index of next sample to use)
+        self._rng = np.random.default_rng(seed)
+        self._unit_iat = []
+        self._los_draws = []
+        self._draw_idx = 0
   
     
-    def _adjust_bed_numbers(self, action):       
+    def _apply_bed_change(self, delta):       
         
         """
-        introduces a delay before bed numbers actually change.
-        If delay >0 then reduce by 0.001 to include count in next action return
+        Handler for bed change event (scheduled in step after a delay).
+        Carries out the requested change in bed numbers, moving it from
+        pending bed changes to beds.
         """
         
-        self.state['spare_beds'] = self.state['beds'] - self.state['patients']
-        
-        # Simpy environemnt timeout (delay) before bed numbers change
-        delay = max(self.delay_to_change_beds - 0.001, 0)
-        yield self.env.timeout(delay)
-        
-        # Update state weekday
-        self.state['weekday'] = int((self.env.now) % 7)   
-        
         # Adjust beds
-        if action == 0:
-            self.state['beds'] -= 20
-            self.state['pending_bed_change'] += 20
-        elif action == 1:
-            self.state['beds'] -= 10
-            self.state['pending_bed_change'] += 10
-        elif action == 2:
-            self.state['beds'] += 0
-            self.state['pending_bed_change'] += 0
-        elif action == 3:
-            self.state['beds'] += 10
-            self.state['pending_bed_change'] -= 10
-        elif action == 4:
-            self.state['beds'] += 20
-            self.state['pending_bed_change'] -= 20
+        s = self.s
+        s[PENDING] -= delta
+        s[BEDS] += delta
             
-        self.state['spare_beds'] = self.state['beds'] - self.state['patients']
+        s[SPARE] = s[BEDS] - s[PATIENTS]
             
             
-    def _adjust_pending_bed_change(self, action):
-        """
-        Adjust tracker (in state dictionary) of bed changes requested but not
-        yet carried out.
-        """
-                
-        # Update state weekday
-        self.state['weekday'] = int((self.env.now) % 7)
-        
-        # Adjust pending bed changes
-        if action == 0:
-            self.state['pending_bed_change'] -= 20
-        elif action == 1:
-            self.state['pending_bed_change'] -= 10
-        elif action == 3:
-            self.state['pending_bed_change'] += 10
-        elif action == 4:
-            self.state['pending_bed_change'] += 20        
-            
+    @property
+    def state(self):
+        """State as dictionary (built from state list, for display)"""
+        
+        return dict(zip(self._state_keys, self.s))
+    
     
     def _calculate_reward(self):
         """
         Calculate reward (always negative or 0)
         """
         
-        target_spare_beds = int(self.state['patients'] * self.target_reserve)
-        spare_beds_above_target = self.state['spare_beds'] - target_spare_beds
+        target_spare_beds = int(self.s[PATIENTS] * self.target_reserve)
+        spare_beds_above_target = self.s[SPARE] - target_spare_beds
         
         # loss = negative value of diffrence in spare beds from target spare beds
         loss = -abs(spare_beds_above_target)
@@ -247,14 +294,30 @@ class HospGym:
         return loss
     
     
+    def _discharge(self, number):
+        """
+        Handler for discharge event. Adjust patient and bed counts as patient
+        leaves hospital. Discharge events of initial load patients discharge
+        `number` patients at once.
+        """
+        
+        s = self.s
+        s[PATIENTS] -= number
+        s[SPARE] = s[BEDS] - s[PATIENTS]
+    
+    
     def _get_observations(self):
-        """Returns current state observation"""
+        """
+        Returns current state observation. The same observations list is
+        overwritten and returned on each call (copy if it is to be kept).
+        """
         
-        # Update weekday
-        self.state['weekday'] = int((self.env.now) % 7)
+        # Update weekday (weekday is only updated in state on observation)
+        self.s[WEEKDAY] = self._weekday
         
-        # Put state dictionary items into observations list
-        observations = [v for k,v in self.state.items()]
+        # Copy state list into observations list (in place)
+        observations = self._obs_buf
+        observations[:] = self.s
         
         # Return starting state observations
         return observations
@@ -262,10 +325,12 @@ class HospGym:
     
     def _islegal(self, action):
         """
-        Check action is in list of allowed actions. If not, raise an exception.
+        Check action is an integer in list of allowed actions. If not, raise
+        an exception (action is used to index bed change tables).
         """
         
-        if action not in self.actions:
+        if (not isinstance(action, numbers.Integral)
+                or action not in self._legal_actions):
             raise ValueError('Requested action not in list of allowed actions')
             
     
@@ -276,87 +341,159 @@ class HospGym:
         """
         
         number_to_load = self.arrivals_per_day * self.los
-        for patient in range(number_to_load):
-            self.state['beds'] += 1
-            self.state['patients'] += 1
-            self.env.process(self._patient_spell(inital_load=True))
+        self.s[BEDS] += number_to_load
+        self.s[PATIENTS] += number_to_load
+        
+        # Sample remaining length of stay for all patients in one call:
+        # length of stay multiplied by random 0-1 to mimic variation of
+        # fraction of los already used
+        remaining_los = (
+            self._rng.exponential(self.los, number_to_load) *
+            self._rng.random(number_to_load))
+        
+        # Count patients leaving in each time step, and schedule one
+        # discharge event for each time step (half way through step). This is
+        # not a change to observations, which are only made at end of steps.
+        time_step_counts = np.bincount(
+            (remaining_los // self.time_step).astype(int))
+        for step_num in np.flatnonzero(time_step_counts).tolist():
+            self._schedule((step_num + 0.5) * self.time_step, DISCHARGE,
+                           int(time_step_counts[step_num]))
             
     
     def _new_admission(self):
         """
-        New admissions to hospital.
-        Sample inter-arrival times from inverse exponential distribution.
-        Inter-arrival times depend on day of week.
+        Handler for admission event. Schedules discharge of new patient, and
+        next admission to hospital.
+        Sample length of stay and inter-arrival times from inverse exponential
+        distribution. Inter-arrival times depend on day of week.
         """
-        while True:
-            # Adjust hospital patient counts
-            self.state['patients'] += 1
-            self.state['spare_beds'] = (
-                self.state['beds'] - self.state['patients'])
         
-            # Call patient spell process
-            self.env.process(self._patient_spell())
-            
-            # Update weekday
-            self.state['weekday'] = int((self.env.now) % 7)
-
-            # Set and call delay before looping back to new patient admission
-            interarrival_time = 1 / self.arrivals_by_day[self.state['weekday']]
-            next_admission = random.expovariate(1 / interarrival_time)
-            yield self.env.timeout(next_admission)
-            
-            
-    def _patient_spell(self, inital_load=False):
+        # Bind attributes used more than once to locals
+        s = self.s
+        now = self.now
+        schedule = self._schedule
+        
+        # Adjust hospital patient counts
+        s[PATIENTS] += 1
+        s[SPARE] = s[BEDS] - s[PATIENTS]
+        
+        # Get index of next pre-generated samples (new batch if used up)
+        draw_idx = self._draw_idx
+        if draw_idx == len(self._los_draws):
+            self._sample_draws()
+            draw_idx = 0
+        self._draw_idx = draw_idx + 1
+        
+        # Schedule discharge after length of stay
+        schedule(now + self._los_draws[draw_idx], DISCHARGE, 1)
+        
+        # Schedule next admission (inter-arrival time depends on current
+        # weekday: exponential is scaled by day of week average)
+        iat = self._unit_iat[draw_idx] * self._iat_scale[self._weekday]
+        schedule(now + iat, ADMISSION)
+        
+    
+    def _render_line(self, state):
+        """Line of text describing state (state list) for render"""
+        
+        return (f"Weekday: {state[WEEKDAY]}, "
+                f"Beds: {state[BEDS]}, "
+                f"Patients: {state[PATIENTS]}, "
+                f"Spare beds: {state[SPARE]}, "
+                f"Pending bed change: {state[PENDING]}\n")
+        
+    
+    def _run(self, until):
         """
-        Patient spell in hospital. 
-        Sample length of stay from inverse exponential distribution.
-        If patient is an inital load patient then multiple los by random 0-1
-          to mimic variation of fraction of los already used
+        Process events in event list, in time order, with time before `until`.
+        Simulation time is then set to `until`.
         """
         
-        # Get length of stay from distributin
-        patient_los = random.expovariate(1 / self.los)
-        # If inital load get remaining los by multiplying by random 0-1
-        if inital_load:
-            patient_los *= random.random()
+        # Bind attributes and functions used in loop to locals
+        calendar = self._calendar
+        heappop = heapq.heappop
+        discharge = self._discharge
+        new_admission = self._new_admission
+        apply_bed_change = self._apply_bed_change
+        
+        # Work through days of event list up to the day containing `until`.
+        # All events in earlier days are before `until`; only the last day
+        # needs event times checking. Heaps of completed days are removed,
+        # and weekday is advanced at each midnight passed.
+        last_day = int(until)
+        day = self._day
+        weekday = self._weekday
+        while True:
+            events = calendar.get(day)
+            while events and (day < last_day or events[0][0] < until):
+                self.now, _, kind, payload = heappop(events)
+                if kind == DISCHARGE:
+                    discharge(payload)
+                elif kind == ADMISSION:
+                    new_admission()
+                else:
+                    apply_bed_change(payload)
+            if day >= last_day:
+                break
+            calendar.pop(day, None)
+            day += 1
+            weekday = self._weekday = (weekday + 1) % 7
+        
+        self._day = day
+        self.now = until
         
-        # Simulation timeout for length of stay
-        yield self.env.timeout(patient_los)
+    
+    def _sample_draws(self):
+        """
+        Replace pre-generated samples for admissions with a new batch (of
+        _DRAW_BATCH) of unit exponential inter-arrival times and lengths of
+        stay, in one NumPy call for each. Batch size is fixed, so memory use
+        does not grow with simulation duration.
+        """
         
-        # Update weekday
-        self.state['weekday'] = int((self.env.now) % 7)
-            
-        # Adjust patient and bed counts as patient leaves hospital
-        self.state['patients'] -= 1
-        self.state['spare_beds'] = self.state['beds'] - self.state['patients']     
+        self._unit_iat = self._rng.standard_exponential(
+            self._DRAW_BATCH).tolist()
+        self._los_draws = self._rng.exponential(
+            self.los, self._DRAW_BATCH).tolist()
+        self._draw_idx = 0
+        
+    
+    def _schedule(self, time, kind, payload=None):
+        """Add event to event list (in heap for day of event)"""
+        
+        day = int(time)
+        events = self._calendar.get(day)
+        if events is None:
+            events = self._calendar[day] = []
+        heapq.heappush(events, (time, next(self._event_id), kind, payload))
      
     
     def render(self):
-        """Display current state"""
+        """Display current state (in a single write to stdout)"""
         
-        print (f"Weekday: {self.state['weekday']}, ", end = '')
-        print (f"Beds: {self.state['beds']}, ", end = '')
-        print (f"Patients: {self.state['patients']}, ", end = '')
-        print (f"Spare beds: {self.state['spare_beds']}, ", end = '')
-        print (f"Pending bed change: {self.state['pending_bed_change']}")
+        sys.stdout.write(self._render_line(self.s))
         
     
     def reset(self):
         """Reset environemnt"""
         
-        # Initialise simpy environemnt
-        self.env = simpy.Environment()
+        # Initialise simulation time and event list
+        self.now = 0
         self.next_time_stop = 0
+        self._calendar = dict()
+        self._day = 0
+        self._weekday = 0
+        self._event_id = itertools.count()
+        
+        # Pre-generate random samples for admissions
+        self._sample_draws()
         
-        # Set up starting processes
-        self.env.process(self._new_admission())
+        # Schedule first admission
+        self._schedule(0, ADMISSION)
 
         # Set starting state values
-        self.state['weekday'] = 0
-        self.state['beds'] = 0
-        self.state['patients'] = 0
-        self.state['spare_beds'] = 0
-        self.state['pending_bed_change'] = 0
+        self.s[:] = [0] * 5
         
         # Inital load of patients (to average occupancy)
         self._load_patients()
@@ -380,50 +517,55 @@ class HospGym:
         changes actually occuring (specified in self.delay_to_change_beds).
         
         The step method:
-         1. Tracks changes to requested bed numbers
-         2. Updates weekday
-         3. Calls bed change process
-         4. Calls a step in the simulation
-         5. Puts state dictionary items into observations list
-         6. Checks whether terminal state reached (based on sim time)
-         7. Get reward
-         8. Creates empty info dictionary (used to be compatble with OpenAI Gym)
-         9. Renders environemnt if requested
-        10. Returns (observations, reward, terminal, info)
+         1. Tracks changes to requested bed numbers and schedules bed change
+            event
+         2. Calls a step in the simulation
+         3. Updates weekday and copies state list into observations list
+         4. Checks whether terminal state reached (based on sim time)
+         5. Get reward
+         6. Gets empty info dictionary (used to be compatble with OpenAI Gym)
+         7. Renders environemnt if requested
+         8. Returns (observations, reward, terminal, info)
                 
         Returns
         -------
         * observations: weekday, beds, patients, spare_beds, pending_bed_change
+          (the same list is overwritten each step; copy if it is to be kept)
         * reward: pentalty of unoccupied beds or patients without beds
         * terminal: if sim has reached specified duration
-        * info: an empty dictionary
+        * info: an empty dictionary (the same dictionary is returned each step)
             
         """
         
         # Check action is legal (raise exception if not):
         self._islegal(action)
                     
-        # Adjust pending bed change (tracks changes in beds due)
-        self._adjust_pending_bed_change(action)
-            
-        # Call bed change process
-        self.env.process(self._adjust_bed_numbers(action))        
+        # Adjust pending bed change (tracks changes in beds due), and schedule
+        # bed change event to carry out the change. Bed numbers change after
+        # delay (if delay >0 then reduce by 0.001 to include count in next
+        # action return). No change in beds requested (action 2) needs no
+        # event.
+        delta = self._BED_DELTA[action]
+        if delta:
+            self.s[PENDING] += delta
+            delay = max(self.delay_to_change_beds - 0.001, 0)
+            self._schedule(self.now + delay, BED_CHANGE, delta)
         
         # Make a step in the simulation
         self.next_time_stop += self.time_step
-        self.env.run(until=self.next_time_stop)
+        self._run(until=self.next_time_stop)
         
         # Get new observations
         observations = self._get_observations()
         
         # Check whether terminal state reached (based on sim time)
-        terminal = True if self.env.now >= self.sim_duration else False
+        terminal = True if self.now >= self.sim_duration else False
         
         # Get reward
         reward = self._calculate_reward()
         
         # Information is empty dictionary (used to be compatble with OpenAI Gym)
-        info = dict()
+        info = self._info
         
         # Render environment if requested
         if self.render_env:
@@ -431,3 +573,156 @@ class HospGym:
         
         # Return tuple of observations, reward, terminal, info
         return (observations, reward, terminal, info)
+
+
+class BatchedHospGym:
+    """
+    A batch of independent HospGym hospital simulations, stepped together
+    (for training Reinforcement Learning agents on many environments at
+    once). Each hospital is a HospGym; observations, rewards and terminal
+    flags of all hospitals are returned stacked in NumPy arrays (row, or
+    value, for each hospital).
+    
+    
+    Interfacing methods:
+    --------------------
+
+    render:
+        Display state of each hospital
+    reset:
+        Initialise all hospitals
+        Return array of first state observations
+    step:
+        Take one action for each hospital. Return arrays of obs, reward,
+        terminal, and info
+        
+        
+    Input parameters (converted to attributes)
+    ------------------------------------------
+    
+    num_envs:
+        Number of hospitals in batch
+    render_env:
+        Boolean, render state of all hospitals each action?
+    seed:
+        Seed for random number generators (None for unseeded). Each hospital
+        gets its own independent generator spawned from the seed.
+    **kwargs:
+        Other input parameters of HospGym (same for all hospitals in batch)
+        
+        
+    Additional attributes:
+    ----------------------
+    
+    actions:
+        List of possible actions (as HospGym)
+    action_size:
+        Number of possible actions   
+    envs:
+        List of HospGym environments (one for each hospital)
+    observation_size:
+        Number of features in observation space (per hospital)
+    """
+    
+    # Fixed set of instance attributes (as HospGym)
+    __slots__ = ('action_size', 'actions', 'envs', 'num_envs',
+                 'observation_size', 'render_env', '_info')
+    
+    def __init__(self, num_envs=8, render_env=False, seed=None, **kwargs):
+        """
+        Constructor method for BatchedHospGym class.
+        
+        Input Parameters
+        ----------------
+        
+        num_envs:
+            Number of hospitals in batch
+        render_env:
+            Boolean, render state of all hospitals
+        seed:
+            Seed for random number generators (None for unseeded)
+        **kwargs:
+            Other input parameters of HospGym (same for all hospitals)
+        """
+        
+        # Set up hospitals (rendered together by batch, not individually),
+        # each with independent random numbers spawned from seed
+        self.num_envs = num_envs
+        self.render_env = render_env
+        seeds = np.random.SeedSequence(seed).spawn(num_envs)
+        self.envs = [HospGym(seed=env_seed, **kwargs) for env_seed in seeds]
+        
+        # Action and observation spaces are those of each hospital
+        self.actions = self.envs[0].actions
+        self.action_size = self.envs[0].action_size
+        self.observation_size = self.envs[0].observation_size
+        
+        # Info is empty dictionary (used to be compatble with OpenAI Gym)
+        self._info = dict()
+    
+    
+    def _islegal(self, actions):
+        """
+        Check there is one action for each hospital, and all actions are
+        integers in list of allowed actions. If not, raise an exception
+        (before any hospital is stepped).
+        """
+        
+        if actions.shape != (self.num_envs,):
+            raise ValueError('Requested actions must have one action for '
+                             'each hospital')
+        if (actions.dtype.kind not in 'iu'
+                or not np.isin(actions, self.actions).all()):
+            raise ValueError('Requested action not in list of allowed actions')
+    
+    
+    def render(self):
+        """
+        Display current state (line for each hospital, in a single write to
+        stdout)
+        """
+        
+        sys.stdout.write(
+            ''.join([env._render_line(env.s) for env in self.envs]))
+    
+    
+    def reset(self):
+        """
+        Reset all hospitals. Return array of starting state observations (row
+        for each hospital).
+        """
+        
+        return np.array([env.reset() for env in self.envs])
+    
+    
+    def step(self, actions):
+        """
+        Interaction with environemnt: one action for each hospital (actions as
+        HospGym). Each hospital is stepped in turn.
+        
+        Returns
+        -------
+        * observations: array, row for each hospital of weekday, beds,
+          patients, spare_beds, pending_bed_change
+        * reward: array of reward for each hospital
+        * terminal: array of terminal flag for each hospital
+        * info: an empty dictionary (the same dictionary is returned each step)
+        """
+        
+        # Check actions are legal (raise exception if not):
+        actions = np.asarray(actions)
+        self._islegal(actions)
+        
+        # Step each hospital, and stack returns into arrays
+        returns = [env.step(action)
+                   for env, action in zip(self.envs, actions.tolist())]
+        observations = np.array([r[0] for r in returns])
+        reward = np.array([r[1] for r in returns])
+        terminal = np.array([r[2] for r in returns])
+        
+        # Render environment if requested
+        if self.render_env:
+            self.render()
+        
+        # Return tuple of observations, reward, terminal, info
+        return (observations, reward, terminal, self._info)